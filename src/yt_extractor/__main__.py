@@ -1,37 +1,64 @@
 """CLI entry point for YouTube video extractor."""
 
+import argparse
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from .extractor import VideoExtractor
-from .exporter import ExcelExporter
-from .config_loader import ConfigLoader
+from typing import Any
+from .config import OUTPUT_FORMATS
+from .types import Video
+
+# Heavy dependencies (yt_dlp, xlsxwriter, yaml) are imported inside the
+# functions that need them so that --help and usage errors start instantly
+
+USAGE_EXAMPLES = """examples:
+  yt-extractor 'https://www.youtube.com/@AlexHormozi'
+  yt-extractor --config channels.yaml
+  yt-extractor --config channels.yaml --jobs 4
+  yt-extractor 'https://www.youtube.com/@AlexHormozi' --limit 100 --full
+  yt-extractor 'https://www.youtube.com/@AlexHormozi' --format csv"""
 
 
 def main() -> None:
     """Main CLI function."""
+    parser = _build_parser()
+    
     # Check arguments
     if len(sys.argv) < 2:
-        print("Usage:")
-        print("  yt-extractor <channel_url>              # Extract from a single channel")
-        print("  yt-extractor --config <config.yaml>     # Extract from channels in config file")
-        print("\nExamples:")
-        print("  yt-extractor 'https://www.youtube.com/@AlexHormozi'")
-        print("  yt-extractor --config channels.yaml")
+        parser.print_help()
         sys.exit(1)
     
+    args = parser.parse_args()
+    
+    if args.limit is not None and args.limit < 1:
+        parser.error("--limit must be at least 1")
+    
+    if args.jobs is not None:
+        if not args.config:
+            parser.error("--jobs can only be used with --config")
+        if args.jobs < 1:
+            parser.error("--jobs must be at least 1")
+    
     try:
         # Check if using config file
-        if sys.argv[1] == "--config" or sys.argv[1] == "-c":
-            if len(sys.argv) < 3:
-                print("Error: Config file path required", file=sys.stderr)
-                sys.exit(1)
-            
-            config_path = sys.argv[2]
-            process_config_file(config_path)
+        if args.config:
+            process_config_file(
+                args.config,
+                args.jobs,
+                limit=args.limit,
+                full=args.full,
+                output_format=args.format,
+            )
         else:
             # Direct URL mode
-            channel_url = sys.argv[1]
-            process_single_channel(channel_url)
+            process_single_channel(
+                args.channel_url,
+                limit=args.limit,
+                full=args.full,
+                output_format=args.format or "xlsx",
+            )
         
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
@@ -41,39 +68,120 @@ def main() -> None:
         sys.exit(1)
 
 
-def process_single_channel(channel_url: str, output_dir: Path | None = None, filename_format: str | None = None) -> None:
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="yt-extractor",
+        description="Extract all videos from a YouTube channel and export them to Excel.",
+        epilog=USAGE_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "channel_url",
+        nargs="?",
+        help="extract from a single channel",
+    )
+    source.add_argument(
+        "-c", "--config",
+        metavar="CONFIG",
+        help="extract from channels in a YAML config file",
+    )
+    
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        metavar="N",
+        help="fetch up to N channels from the config file in parallel",
+    )
+    parser.add_argument(
+        "-l", "--limit",
+        type=int,
+        metavar="N",
+        help="only fetch the first N videos of each channel playlist",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="fetch every video individually to include descriptions (slow)",
+    )
+    parser.add_argument(
+        "-f", "--format",
+        choices=OUTPUT_FORMATS,
+        help="output file format; 'auto' writes CSV for channels with more "
+        "than 50,000 videos (default: xlsx)",
+    )
+    
+    return parser
+
+
+def process_single_channel(
+    channel_url: str,
+    output_dir: Path | None = None,
+    filename_format: str | None = None,
+    limit: int | None = None,
+    full: bool = False,
+    output_format: str = "xlsx",
+) -> None:
     """Process a single channel URL.
     
     Args:
         channel_url: YouTube channel URL
         output_dir: Optional output directory
         filename_format: Optional filename format string
+        limit: Optional maximum number of videos per channel playlist
+        full: Fetch each video individually to include descriptions
+        output_format: Output file format ("xlsx", "csv" or "auto")
     """
+    from .exporter import ExcelExporter
+    from .extractor import VideoExtractor
+    
     print(f"Extracting videos from: {channel_url}")
-    extractor = VideoExtractor(channel_url)
-    videos, channel_name = extractor.extract()
+    extractor = VideoExtractor(channel_url, limit=limit, full=full)
+    videos = extractor.iter_videos()
+    channel_name = extractor.channel_name
     
-    print(f"Found {len(videos)} videos from channel: {channel_name}")
+    print(f"Found channel: {channel_name}")
     
-    if not videos:
+    first_video = next(videos, None)
+    if first_video is None:
         print("No videos found!")
         return
     
-    # Export to Excel
-    print("Exporting to Excel...")
-    exporter = ExcelExporter(videos, channel_name)
-    output_path = exporter.export(output_dir, filename_format)
+    # Export, streaming rows unless they need sorting
+    print("Exporting...")
+    exporter = ExcelExporter(
+        chain((first_video,), videos),
+        channel_name,
+        sort_by_date=extractor.has_upload_dates,
+    )
+    output_path = exporter.export_as(output_format, output_dir, filename_format)
     
     print(f"✓ Successfully exported to: {output_path}")
-    print(f"  Total videos: {len(videos)}")
+    print(f"  Total videos: {exporter.video_count}")
 
 
-def process_config_file(config_path: str) -> None:
+def process_config_file(
+    config_path: str,
+    jobs: int | None = None,
+    limit: int | None = None,
+    full: bool = False,
+    output_format: str | None = None,
+) -> None:
     """Process channels from a YAML configuration file.
     
     Args:
         config_path: Path to YAML configuration file
+        jobs: Number of channels to fetch in parallel
+            (defaults to the 'parallel_fetch' output setting)
+        limit: Optional maximum number of videos per channel playlist
+        full: Fetch each video individually to include descriptions
+        output_format: Output file format ("xlsx", "csv" or "auto")
+            (defaults to the 'format' output setting)
     """
+    from .config_loader import ConfigLoader
+    
     print(f"Loading configuration from: {config_path}")
     
     # Load configuration
@@ -83,45 +191,153 @@ def process_config_file(config_path: str) -> None:
     channels = loader.get_enabled_channels()
     output_settings = loader.get_output_settings()
     
+    if jobs is None:
+        jobs = output_settings["parallel_fetch"]
+    
+    if output_format is not None:
+        output_settings = {**output_settings, "format": output_format}
+    
     print(f"Found {len(channels)} enabled channel(s)\n")
     
-    # Process each channel
-    for i, channel in enumerate(channels, 1):
-        channel_name = channel.get("name", f"Channel {i}")
-        channel_url = channel["url"]
+    if jobs > 1 and len(channels) > 1:
+        _process_channels_parallel(channels, output_settings, limit, full, jobs)
+    else:
+        _process_channels_serial(channels, output_settings, limit, full)
+    
+    print("All channels processed!")
+
+
+def _process_channels_serial(
+    channels: list[dict[str, Any]],
+    output_settings: dict[str, Any],
+    limit: int | None,
+    full: bool,
+) -> None:
+    """Extract and export channels one at a time.
+    
+    Args:
+        channels: Enabled channel configurations
+        output_settings: Output settings from the configuration
+        limit: Optional maximum number of videos per channel playlist
+        full: Fetch each video individually to include descriptions
+    """
+    from .extractor import VideoExtractor
+    
+    # One YoutubeDL instance is shared by all channels
+    with VideoExtractor.create_ydl(limit) as ydl:
+        for i, channel in enumerate(channels, 1):
+            print(f"[{i}/{len(channels)}] Processing: {channel.get('name', f'Channel {i}')}")
+            print(f"  URL: {channel['url']}")
+            
+            try:
+                # Extract videos
+                extractor = VideoExtractor(channel["url"], full=full, ydl=ydl)
+                videos = extractor.iter_videos()
+                
+                _export_channel(
+                    i,
+                    channel,
+                    videos,
+                    extractor.channel_name,
+                    output_settings,
+                    sort_by_date=extractor.has_upload_dates,
+                )
+                
+            except Exception as e:
+                print(f"  ✗ Failed: {e}\n", file=sys.stderr)
+                continue
+
+
+def _process_channels_parallel(
+    channels: list[dict[str, Any]],
+    output_settings: dict[str, Any],
+    limit: int | None,
+    full: bool,
+    jobs: int,
+) -> None:
+    """Extract channels concurrently and export them as results arrive.
+    
+    Extraction is network-bound, so it runs in a thread pool. Exports are
+    done sequentially on the calling thread.
+    
+    Args:
+        channels: Enabled channel configurations
+        output_settings: Output settings from the configuration
+        limit: Optional maximum number of videos per channel playlist
+        full: Fetch each video individually to include descriptions
+        jobs: Maximum number of concurrent extractions
+    """
+    from .extractor import VideoExtractor, per_thread_ydl
+    
+    print(f"Fetching channels with {min(jobs, len(channels))} parallel worker(s)\n")
+    
+    # Each worker thread reuses its own YoutubeDL instance across channels
+    ydl_options = VideoExtractor.ydl_options(limit)
+    with (
+        per_thread_ydl(ydl_options) as get_ydl,
+        ThreadPoolExecutor(max_workers=min(jobs, len(channels))) as executor,
+    ):
+        def extract(channel_url: str) -> tuple[list[Video], str]:
+            return VideoExtractor(channel_url, full=full, ydl=get_ydl()).extract()
         
-        print(f"[{i}/{len(channels)}] Processing: {channel_name}")
-        print(f"  URL: {channel_url}")
+        futures = {
+            executor.submit(extract, channel["url"]): (i, channel)
+            for i, channel in enumerate(channels, 1)
+        }
         
-        try:
-            # Extract videos
-            extractor = VideoExtractor(channel_url)
-            videos, extracted_name = extractor.extract()
-            
-            # Use extracted name if no name was provided in config
-            if channel.get("name") == f"Channel {i}":
-                channel_name = extracted_name
+        for future in as_completed(futures):
+            i, channel = futures[future]
+            print(f"[{i}/{len(channels)}] Processing: {channel.get('name', f'Channel {i}')}")
+            print(f"  URL: {channel['url']}")
             
-            print(f"  Found {len(videos)} videos")
-            
-            if not videos:
-                print("  No videos found, skipping...\n")
+            try:
+                videos, extracted_name = future.result()
+                _export_channel(i, channel, iter(videos), extracted_name, output_settings)
+                
+            except Exception as e:
+                print(f"  ✗ Failed: {e}\n", file=sys.stderr)
                 continue
-            
-            # Export to Excel
-            output_dir = Path(output_settings["directory"])
-            filename_format = output_settings.get("filename_format")
-            exporter = ExcelExporter(videos, channel_name)
-            output_path = exporter.export(output_dir, filename_format)
-            
-            print(f"  ✓ Exported to: {output_path}")
-            print(f"  Total videos: {len(videos)}\n")
-            
-        except Exception as e:
-            print(f"  ✗ Failed: {e}\n", file=sys.stderr)
-            continue
+
+
+def _export_channel(
+    index: int,
+    channel: dict[str, Any],
+    videos: Iterator[Video],
+    extracted_name: str,
+    output_settings: dict[str, Any],
+    sort_by_date: bool = True,
+) -> None:
+    """Export the extracted videos of one configured channel.
     
-    print("All channels processed!")
+    Args:
+        index: 1-based position of the channel in the configuration
+        channel: Channel configuration
+        videos: Extracted videos
+        extracted_name: Channel name reported by YouTube
+        output_settings: Output settings from the configuration
+        sort_by_date: Sort videos newest first instead of streaming them
+    """
+    from .exporter import ExcelExporter
+    
+    channel_name = channel.get("name", f"Channel {index}")
+    
+    # Use extracted name if no name was provided in config
+    if channel.get("name") == f"Channel {index}":
+        channel_name = extracted_name
+    
+    first_video = next(videos, None)
+    if first_video is None:
+        print("  No videos found, skipping...\n")
+        return
+    
+    # Export in the configured format
+    output_dir = Path(output_settings["directory"])
+    filename_format = output_settings.get("filename_format")
+    exporter = ExcelExporter(chain((first_video,), videos), channel_name, sort_by_date)
+    output_path = exporter.export_as(output_settings["format"], output_dir, filename_format)
+    
+    print(f"  ✓ Exported to: {output_path}")
+    print(f"  Total videos: {exporter.video_count}\n")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,13 @@
 # Excel column headers
 EXCEL_COLUMNS = ["ID", "Title", "Description", "URL"]
 
+# Prefix for video watch URLs (the video ID is appended)
+VIDEO_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+# Descriptions shorter than this are interned, since channels often repeat
+# the same boilerplate description across many videos
+MAX_INTERNED_DESCRIPTION_LENGTH = 4096
+
 # yt-dlp options for extracting video information
 YT_DLP_OPTIONS = {
     "quiet": True,
@@ -11,3 +18,12 @@ YT_DLP_OPTIONS = {
     "skip_download": True,
     "no_check_certificates": True,  # Fix for SSL certificate issues on macOS
 }
+
+# Number of concurrent per-video requests when fetching full descriptions
+FULL_FETCH_WORKERS = 8
+
+# Supported output file formats ("auto" picks CSV for very large channels)
+OUTPUT_FORMATS = ["xlsx", "csv", "auto"]
+
+# Above this many videos, the "auto" output format writes CSV instead of Excel
+CSV_AUTO_THRESHOLD = 50_000
@@ -2,7 +2,44 @@
 
 from pathlib import Path
 from typing import Any
+import fastjsonschema
 import yaml
+from .config import OUTPUT_FORMATS
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader
+
+# Compiled once at import; fastjsonschema generates a specialized validator
+_VALIDATOR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["channels"],
+    "properties": {
+        "channels": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["url"],
+                "properties": {
+                    "url": {"type": "string"},
+                    "name": {"type": ["string", "number"]},
+                    "enabled": {"type": "boolean"},
+                },
+            },
+        },
+        "output": {
+            "type": "object",
+            "properties": {
+                "directory": {"type": "string"},
+                "filename_format": {"type": "string"},
+                "parallel_fetch": {"type": "integer", "minimum": 1},
+                "format": {"enum": OUTPUT_FORMATS},
+            },
+        },
+    },
+})
 
 
 class ConfigLoader:
@@ -16,6 +53,8 @@ class ConfigLoader:
         """
         self.config_path = Path(config_path)
         self._config: dict[str, Any] = {}
+        self._loaded: bool = False
+        self._output_settings: dict[str, Any] | None = None
     
     def load(self) -> dict[str, Any]:
         """Load configuration from YAML file.
@@ -32,9 +71,11 @@ class ConfigLoader:
         
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml.load(f, Loader=_SafeLoader) or {}
             
             self._validate()
+            self._output_settings = None
+            self._loaded = True
             return self._config
             
         except yaml.YAMLError as e:
@@ -46,30 +87,20 @@ class ConfigLoader:
         Raises:
             ValueError: If configuration is invalid
         """
-        if "channels" not in self._config:
-            raise ValueError("Configuration must contain 'channels' key")
-        
-        channels = self._config["channels"]
-        if not isinstance(channels, list):
-            raise ValueError("'channels' must be a list")
-        
-        if not channels:
-            raise ValueError("At least one channel must be defined")
+        try:
+            _VALIDATOR(self._config)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValueError(f"Invalid configuration: {e.message}") from e
         
-        for i, channel in enumerate(channels):
-            if not isinstance(channel, dict):
-                raise ValueError(f"Channel {i} must be a dictionary")
-            
-            if "url" not in channel:
-                raise ValueError(f"Channel {i} missing required 'url' field")
-            
+        for i, channel in enumerate(self._config["channels"]):
             # Set defaults
-            if "enabled" not in channel:
-                channel["enabled"] = True
+            channel.setdefault("enabled", True)
             
-            if "name" not in channel:
-                # Extract name from URL or use index
-                channel["name"] = f"Channel {i + 1}"
+            # Extract name from URL or use index
+            channel.setdefault("name", f"Channel {i + 1}")
+            
+            # Unquoted numeric names (e.g. name: 2024) are used as text
+            channel["name"] = str(channel["name"])
     
     def get_enabled_channels(self) -> list[dict[str, Any]]:
         """Get list of enabled channels.
@@ -77,7 +108,7 @@ class ConfigLoader:
         Returns:
             List of enabled channel configurations
         """
-        if not self._config:
+        if not self._loaded:
             self.load()
         
         return [
@@ -92,13 +123,18 @@ class ConfigLoader:
         Returns:
             Output settings dictionary with defaults
         """
-        if not self._config:
+        if not self._loaded:
             self.load()
         
-        defaults = {
-            "directory": "outputs",
-            "filename_format": "{channel_name}_videos.xlsx",
-        }
+        if self._output_settings is None:
+            defaults = {
+                "directory": "outputs",
+                "filename_format": "{channel_name}_videos.xlsx",
+                "parallel_fetch": 1,
+                "format": "xlsx",
+            }
+            
+            output = self._config.get("output", {})
+            self._output_settings = {**defaults, **output}
         
-        output = self._config.get("output", {})
-        return {**defaults, **output}
+        return self._output_settings
@@ -1,25 +1,52 @@
-"""Excel export functionality."""
+"""Excel and CSV export functionality."""
 
+import csv
+import functools
+import re
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-from .config import EXCEL_COLUMNS
+import xlsxwriter
+from .config import CSV_AUTO_THRESHOLD, EXCEL_COLUMNS
+from .types import Video
+
+
+# Runs of filesystem-invalid characters and control characters
+_FN_BAD = re.compile(r'[<>:"/\\|?*\x00-\x1f]+')
+
+
+@functools.lru_cache(maxsize=1)
+def _run_date() -> str:
+    """Get the date used in filenames, computed once per run.
+    
+    Long-running processes can call _run_date.cache_clear() to refresh it.
+    """
+    return datetime.now().strftime("%Y%m%d")
 
 
 class ExcelExporter:
-    """Exports video data to Excel format."""
+    """Exports video data to Excel or CSV format."""
     
-    def __init__(self, videos: list[dict[str, Any]], channel_name: str) -> None:
+    def __init__(
+        self,
+        videos: Iterable[Video],
+        channel_name: str,
+        sort_by_date: bool = True,
+    ) -> None:
         """Initialize the exporter with video data.
         
         Args:
-            videos: List of video dictionaries
+            videos: Videos to export (a list or a lazy iterator)
             channel_name: Name of the YouTube channel
+            sort_by_date: Sort videos newest first. When False, videos are
+                streamed to the file in the given order without buffering
         """
         self.videos = videos
         self.channel_name = channel_name
+        self.sort_by_date = sort_by_date
+        self.video_count = 0
     
     def export(self, output_dir: Path | None = None, filename_format: str | None = None) -> Path:
         """Export videos to an Excel file.
@@ -35,82 +62,201 @@ class ExcelExporter:
             Exception: If export fails
         """
         try:
-            # Sort videos by upload_date (newest first)
-            # Handle None values by using empty string as default
-            sorted_videos = sorted(
-                self.videos,
-                key=lambda x: x.get("upload_date") or "",
-                reverse=True
-            )
-            
-            # Create workbook and worksheet
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Videos"
-            
-            # Write header row
-            ws.append(EXCEL_COLUMNS)
+            sorted_videos = self._ordered_videos()
+            output_path = self._output_path(output_dir, filename_format)
             
-            # Style header row
-            for cell in ws[1]:
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal="center")
-            
-            # Write video data
-            for video in sorted_videos:
-                ws.append([
-                    video.get("id", ""),
-                    video.get("title", ""),
-                    video.get("description", ""),
-                    video.get("url", ""),
-                ])
+            # Create workbook and worksheet; constant_memory flushes each row
+            # to disk as soon as it is written
+            workbook = xlsxwriter.Workbook(
+                str(output_path),
+                {"constant_memory": True, "strings_to_urls": False},
+            )
+            ws = workbook.add_worksheet("Videos")
             
             # Auto-adjust column widths
             self._adjust_column_widths(ws)
             
-            # Determine output path
-            if output_dir is None:
-                output_dir = Path.cwd() / "outputs"
-            else:
-                output_dir = Path(output_dir)
+            # Write styled header row
+            header_format = workbook.add_format({"bold": True, "align": "center"})
+            ws.write_row(0, 0, EXCEL_COLUMNS, header_format)
             
-            # Create output directory if it doesn't exist
-            output_dir.mkdir(parents=True, exist_ok=True)
+            # Write video data; every column is text, so write_string skips
+            # xlsxwriter's per-cell type detection (and formula coercion of
+            # descriptions starting with "=")
+            write_string = ws.write_string
+            row = 0
+            for row, video in enumerate(sorted_videos, 1):
+                write_string(row, 0, video.id)
+                write_string(row, 1, video.title)
+                write_string(row, 2, video.description)
+                write_string(row, 3, video.url)
             
-            # Generate filename
-            if filename_format is None:
-                filename_format = "{channel_name}_videos.xlsx"
+            self.video_count = row
             
-            # Get current date
-            current_date = datetime.now().strftime("%Y%m%d")
+            # Save workbook
+            workbook.close()
             
-            # Sanitize channel name for filename
-            safe_channel_name = self._sanitize_filename(self.channel_name)
+            return output_path
             
-            # Replace placeholders in filename format
-            filename = filename_format.format(
-                channel_name=safe_channel_name,
-                date=current_date
-            )
+        except Exception as e:
+            raise Exception(f"Failed to export to Excel: {str(e)}") from e
+    
+    def export_csv(self, output_dir: Path | None = None, filename_format: str | None = None) -> Path:
+        """Export videos to a CSV file.
+        
+        Much faster than Excel export and uses constant memory, which makes it
+        the better choice for very large channels. A .xlsx extension in
+        filename_format is replaced with .csv; otherwise .csv is appended.
+        
+        Args:
+            output_dir: Directory to save the file (defaults to current directory)
+            filename_format: Format string for filename (supports {channel_name} and {date})
             
-            output_path = output_dir / filename
+        Returns:
+            Path to the created CSV file
             
-            # Save workbook
-            wb.save(output_path)
+        Raises:
+            Exception: If export fails
+        """
+        try:
+            sorted_videos = self._ordered_videos()
+            output_path = self._output_path(output_dir, filename_format)
+            if output_path.suffix.lower() == ".xlsx":
+                output_path = output_path.with_suffix(".csv")
+            else:
+                # Don't treat dots in the channel name as an extension
+                output_path = output_path.with_name(output_path.name + ".csv")
+            
+            # utf-8-sig so Excel detects the encoding when opening the file
+            with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(EXCEL_COLUMNS)
+                
+                writerow = writer.writerow
+                row = 0
+                for row, video in enumerate(sorted_videos, 1):
+                    writerow((video.id, video.title, video.description, video.url))
+                
+                self.video_count = row
             
             return output_path
             
         except Exception as e:
-            raise Exception(f"Failed to export to Excel: {str(e)}") from e
+            raise Exception(f"Failed to export to CSV: {str(e)}") from e
+    
+    def export_auto(self, output_dir: Path | None = None, filename_format: str | None = None) -> Path:
+        """Export to CSV for very large channels and to Excel otherwise.
+        
+        At most CSV_AUTO_THRESHOLD + 1 videos are buffered to decide, so
+        streamed videos stay streamed.
+        
+        Args:
+            output_dir: Directory to save the file (defaults to current directory)
+            filename_format: Format string for filename (supports {channel_name} and {date})
+            
+        Returns:
+            Path to the created file
+        """
+        videos = iter(self.videos)
+        head = list(islice(videos, CSV_AUTO_THRESHOLD + 1))
+        self.videos = chain(head, videos)
+        
+        if len(head) > CSV_AUTO_THRESHOLD:
+            return self.export_csv(output_dir, filename_format)
+        return self.export(output_dir, filename_format)
+    
+    def export_as(
+        self,
+        output_format: str,
+        output_dir: Path | None = None,
+        filename_format: str | None = None,
+    ) -> Path:
+        """Export videos in the given format.
+        
+        Args:
+            output_format: One of "xlsx", "csv" or "auto"
+            output_dir: Directory to save the file (defaults to current directory)
+            filename_format: Format string for filename (supports {channel_name} and {date})
+            
+        Returns:
+            Path to the created file
+            
+        Raises:
+            ValueError: If the output format is unknown
+        """
+        if output_format == "xlsx":
+            return self.export(output_dir, filename_format)
+        if output_format == "csv":
+            return self.export_csv(output_dir, filename_format)
+        if output_format == "auto":
+            return self.export_auto(output_dir, filename_format)
+        
+        raise ValueError(f"Unknown output format: {output_format}")
+    
+    def _ordered_videos(self) -> Iterable[Video]:
+        """Get the videos in output order.
+        
+        Returns:
+            Videos sorted newest first, or the videos as given when sorting
+            is disabled
+        """
+        if not self.sort_by_date:
+            # Stream videos straight into the file without buffering
+            return self.videos
+        
+        # Sort videos by upload_date (newest first)
+        videos = list(self.videos)
+        upload_date = attrgetter("upload_date")
+        if not any(map(upload_date, videos)):
+            # Flat extraction usually yields no dates; nothing to sort
+            return videos
+        return sorted(videos, key=upload_date, reverse=True)
+    
+    def _output_path(self, output_dir: Path | None, filename_format: str | None) -> Path:
+        """Build the output file path, creating the output directory.
+        
+        Args:
+            output_dir: Directory to save the file (defaults to current directory)
+            filename_format: Format string for filename (supports {channel_name} and {date})
+            
+        Returns:
+            Path of the file to write
+        """
+        # Determine output path
+        if output_dir is None:
+            output_dir = Path.cwd() / "outputs"
+        else:
+            output_dir = Path(output_dir)
+        
+        # Create output directory if it doesn't exist
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Generate filename
+        if filename_format is None:
+            filename_format = "{channel_name}_videos.xlsx"
+        
+        # Get the date of this run
+        current_date = _run_date()
+        
+        # Sanitize channel name for filename
+        safe_channel_name = self._sanitize_filename(self.channel_name)
+        
+        # Replace placeholders in filename format
+        filename = filename_format.format(
+            channel_name=safe_channel_name,
+            date=current_date
+        )
+        
+        return output_dir / filename
     
     @staticmethod
     def _adjust_column_widths(ws) -> None:
         """Adjust column widths based on content."""
         # Set reasonable widths for each column
-        ws.column_dimensions["A"].width = 15  # ID
-        ws.column_dimensions["B"].width = 50  # Title
-        ws.column_dimensions["C"].width = 80  # Description
-        ws.column_dimensions["D"].width = 50  # URL
+        ws.set_column("A:A", 15)  # ID
+        ws.set_column("B:B", 50)  # Title
+        ws.set_column("C:C", 80)  # Description
+        ws.set_column("D:D", 50)  # URL
     
     @staticmethod
     def _sanitize_filename(filename: str) -> str:
@@ -122,17 +268,6 @@ class ExcelExporter:
         Returns:
             Sanitized filename safe for filesystem use
         """
-        # Replace invalid characters with underscore
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-        
-        # Remove leading/trailing spaces and dots
-        filename = filename.strip(". ")
-        
-        # Limit length
-        max_length = 100
-        if len(filename) > max_length:
-            filename = filename[:max_length]
-        
-        return filename or "channel"
+        # Replace runs of invalid and control characters with underscore,
+        # remove leading/trailing spaces and dots, and limit length
+        return _FN_BAD.sub("_", filename).strip(". ")[:100] or "channel"
@@ -1,49 +1,243 @@
 """YouTube video extraction logic."""
 
+import contextlib
+import functools
 import ssl
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any
 import certifi
 import yt_dlp
-from .config import YT_DLP_OPTIONS
+from .config import (
+    FULL_FETCH_WORKERS,
+    MAX_INTERNED_DESCRIPTION_LENGTH,
+    VIDEO_URL_PREFIX,
+    YT_DLP_OPTIONS,
+)
+from .types import Video
 
 
+@functools.lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    """Create the SSL context with certifi certificates once per process."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _intern_description(description: str) -> str:
+    """Intern short descriptions so repeated boilerplate shares one string."""
+    if len(description) < MAX_INTERNED_DESCRIPTION_LENGTH:
+        return sys.intern(description)
+    return description
+
+
+def _upload_date(entry: dict[str, Any]) -> str:
+    """Get an entry's upload date as a YYYYMMDD string.
+    
+    Falls back to the release timestamp (an epoch int), converted in UTC
+    to the same format, so dates always sort consistently.
+    
+    Args:
+        entry: Video entry returned by yt-dlp
+        
+    Returns:
+        Upload date, or an empty string if unknown
+    """
+    upload_date = entry.get("upload_date")
+    if upload_date:
+        return str(upload_date)
+    
+    release_timestamp = entry.get("release_timestamp")
+    if release_timestamp:
+        return datetime.fromtimestamp(release_timestamp, timezone.utc).strftime("%Y%m%d")
+    
+    return ""
+
+
+def _iter_entries(entries: Iterable[dict[str, Any] | None]) -> Iterator[dict[str, Any]]:
+    """Yield video entries, flattening playlists/tabs (Videos, Shorts, Live).
+    
+    Args:
+        entries: Top-level entries returned by yt-dlp
+        
+    Yields:
+        Non-empty video entries
+    """
+    for entry in entries:
+        if not entry:
+            continue
+        
+        # Check if this is a playlist/tab
+        if entry.get("_type") == "playlist":
+            yield from (e for e in entry.get("entries") or () if e)
+        else:
+            # This is a direct video entry
+            yield entry
+
+
+@contextlib.contextmanager
+def per_thread_ydl(options: dict[str, Any]) -> Iterator[Callable[[], yt_dlp.YoutubeDL]]:
+    """Provide one YoutubeDL instance per thread, closing them all on exit.
+    
+    YoutubeDL instances can be reused for sequential extractions but are not
+    safe to share between threads, so each worker thread lazily gets its own.
+    
+    Args:
+        options: yt-dlp options for the created instances
+        
+    Yields:
+        A function returning the calling thread's YoutubeDL instance
+    """
+    local = threading.local()
+    instances: list[yt_dlp.YoutubeDL] = []
+    
+    def get_ydl() -> yt_dlp.YoutubeDL:
+        ydl = getattr(local, "ydl", None)
+        if ydl is None:
+            ydl = local.ydl = yt_dlp.YoutubeDL(options)
+            instances.append(ydl)
+        return ydl
+    
+    try:
+        yield get_ydl
+    finally:
+        for ydl in instances:
+            ydl.close()
+
+
+def _fetch_descriptions(video_ids: list[str], options: dict[str, Any]) -> dict[str, str]:
+    """Fetch full descriptions by extracting each video individually.
+    
+    Requests run in a thread pool with one YoutubeDL instance per worker.
+    Videos that fail to extract get an empty description.
+    
+    Args:
+        video_ids: IDs of the videos to fetch
+        options: Base yt-dlp options
+        
+    Returns:
+        Mapping of video ID to description
+    """
+    with per_thread_ydl({**options, "extract_flat": False}) as get_ydl:
+        def fetch(video_id: str) -> str:
+            try:
+                info = get_ydl().extract_info(
+                    f"{VIDEO_URL_PREFIX}{video_id}", download=False, process=False
+                )
+            except yt_dlp.utils.DownloadError:
+                return ""
+            
+            return (info or {}).get("description") or ""
+        
+        with ThreadPoolExecutor(max_workers=FULL_FETCH_WORKERS) as executor:
+            return dict(zip(video_ids, executor.map(fetch, video_ids)))
+
 
 class VideoExtractor:
     """Extracts video metadata from YouTube channels."""
     
-    def __init__(self, channel_url: str) -> None:
+    def __init__(
+        self,
+        channel_url: str,
+        limit: int | None = None,
+        full: bool = False,
+        ydl: yt_dlp.YoutubeDL | None = None,
+    ) -> None:
         """Initialize the extractor with a channel URL.
         
         Args:
             channel_url: The YouTube channel URL to extract videos from
+            limit: Maximum number of entries to request per playlist
+            full: Fetch each video individually to include its description
+            ydl: Shared YoutubeDL instance from create_ydl, reused instead of
+                creating a new one for this channel. Its options, including
+                the limit given to create_ydl, apply to this extraction
+                
+        Raises:
+            ValueError: If both limit and ydl are given
         """
+        if ydl is not None and limit is not None:
+            raise ValueError("Pass limit to create_ydl() when sharing a YoutubeDL instance")
+        
         self.channel_url = channel_url
-        self._videos: list[dict[str, Any]] = []
+        self.limit = ydl.params.get("playlistend") if ydl is not None else limit
+        self.full = full
+        self._ydl = ydl
+        self._videos: list[Video] = []
         self._channel_name: str = ""
+        self._has_upload_dates: bool = False
     
-    def extract(self) -> tuple[list[dict[str, Any]], str]:
+    @staticmethod
+    def ydl_options(limit: int | None = None) -> dict[str, Any]:
+        """Build the yt-dlp options used for channel extraction.
+        
+        Args:
+            limit: Maximum number of entries to request per playlist
+            
+        Returns:
+            yt-dlp options dictionary
+        """
+        # Merge the cached SSL context with certifi certificates into options
+        # (YT_DLP_OPTIONS already sets extract_flat='in_playlist')
+        options = YT_DLP_OPTIONS.copy()
+        options["ssl_context"] = _default_ssl_context()
+        
+        # Only request as many entries as needed
+        if limit is not None:
+            options["playlistend"] = limit
+        
+        return options
+    
+    @classmethod
+    def create_ydl(cls, limit: int | None = None) -> yt_dlp.YoutubeDL:
+        """Create a YoutubeDL instance that can be shared across channels.
+        
+        Creating YoutubeDL is relatively expensive (extractors, cookies,
+        regexes), so sequential extractions should reuse one instance.
+        
+        Args:
+            limit: Maximum number of entries to request per playlist
+            
+        Returns:
+            YoutubeDL instance; the caller is responsible for closing it
+        """
+        return yt_dlp.YoutubeDL(cls.ydl_options(limit))
+    
+    def extract(self) -> tuple[list[Video], str]:
         """Extract all videos from the channel.
         
         Returns:
             A tuple of (videos list, channel name)
-            Each video is a dict with keys: id, title, description, url, upload_date
             
         Raises:
             Exception: If extraction fails
         """
-        try:
-            # Create SSL context with certifi certificates
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self._videos = list(self.iter_videos())
+        return self._videos, self._channel_name
+    
+    def iter_videos(self) -> Iterator[Video]:
+        """Fetch the channel and lazily yield its videos.
+        
+        Channel information is fetched before this method returns, so
+        channel_name and has_upload_dates are available before iterating.
+        Videos are only built as they are consumed.
+        
+        Returns:
+            Iterator over the channel's videos
             
-            # Merge SSL context into options
-            # Use extract_flat='in_playlist' to get video IDs without full metadata
-            options = {
-                **YT_DLP_OPTIONS,
-                "ssl_context": ssl_context,
-                "extract_flat": "in_playlist",  # Get video entries without downloading full metadata
-            }
+        Raises:
+            Exception: If extraction fails
+        """
+        try:
+            # Reuse the shared YoutubeDL instance, or create one for this channel
+            if self._ydl is not None:
+                ydl_context = contextlib.nullcontext(self._ydl)
+            else:
+                ydl_context = self.create_ydl(self.limit)
             
-            with yt_dlp.YoutubeDL(options) as ydl:
+            with ydl_context as ydl:
                 # Extract channel information
                 info = ydl.extract_info(self.channel_url, download=False)
                 
@@ -54,46 +248,41 @@ class VideoExtractor:
                 self._channel_name = info.get("channel", info.get("uploader", "unknown"))
                 
                 # Get all video entries
-                entries = info.get("entries", [])
+                entries = info.get("entries") or []
                 
-                # If entries are playlists (Videos, Shorts, Live), flatten them
-                all_videos = []
-                for entry in entries:
-                    if not entry:
-                        continue
-                    
-                    # Check if this is a playlist/tab
-                    if entry.get("_type") == "playlist":
-                        # Get videos from this playlist
-                        sub_entries = entry.get("entries", [])
-                        all_videos.extend([e for e in sub_entries if e])
-                    else:
-                        # This is a direct video entry
-                        all_videos.append(entry)
+                # Check whether any entry carries a date, so consumers know if
+                # the videos need sorting before they are written
+                self._has_upload_dates = any(
+                    entry.get("upload_date") or entry.get("release_timestamp")
+                    for entry in _iter_entries(entries)
+                )
                 
-                # Extract relevant video information
-                self._videos = []
-                for entry in all_videos:
-                    video_id = entry.get("id", "")
-                    if not video_id:
-                        continue
-                    
-                    video_data = {
-                        "id": video_id,
-                        "title": entry.get("title", ""),
-                        "description": entry.get("description", ""),
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                        "upload_date": entry.get("upload_date", entry.get("release_timestamp", "")),
-                    }
-                    self._videos.append(video_data)
+                # Flat extraction does not include descriptions; only fetch
+                # them, one request per video, in full mode
+                descriptions: dict[str, str] = {}
+                if self.full:
+                    video_ids = list(dict.fromkeys(
+                        entry["id"] for entry in _iter_entries(entries) if entry.get("id")
+                    ))
+                    descriptions = _fetch_descriptions(video_ids, ydl.params)
                 
-                return self._videos, self._channel_name
+                # Flatten playlists and build video information on demand
+                return (
+                    Video(
+                        id=video_id,
+                        title=entry.get("title") or "",
+                        description=_intern_description(descriptions.get(video_id, "")),
+                        upload_date=_upload_date(entry),
+                    )
+                    for entry in _iter_entries(entries)
+                    if (video_id := entry.get("id"))
+                )
                 
         except Exception as e:
             raise Exception(f"Failed to extract videos: {str(e)}") from e
     
     @property
-    def videos(self) -> list[dict[str, Any]]:
+    def videos(self) -> list[Video]:
         """Get the extracted videos."""
         return self._videos
     
@@ -101,3 +290,8 @@ class VideoExtractor:
     def channel_name(self) -> str:
         """Get the channel name."""
         return self._channel_name
+    
+    @property
+    def has_upload_dates(self) -> bool:
+        """Whether any extracted video has an upload date."""
+        return self._has_upload_dates
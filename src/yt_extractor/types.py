@@ -0,0 +1,19 @@
+"""Data types shared by the extractor and exporter."""
+
+from dataclasses import dataclass
+from .config import VIDEO_URL_PREFIX
+
+
+@dataclass(slots=True, frozen=True)
+class Video:
+    """Metadata for a single YouTube video."""
+    
+    id: str
+    title: str
+    description: str
+    upload_date: str
+    
+    @property
+    def url(self) -> str:
+        """Full watch URL, built on demand from the video ID."""
+        return f"{VIDEO_URL_PREFIX}{self.id}"